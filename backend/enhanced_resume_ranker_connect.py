@@ -1,20 +1,32 @@
 import argparse
 import re # “regular expressions” for pattern matching in text
 import fitz  # PyMuPDF Reads PDF files page by page
-import pandas as pd # For DataFrame operations
 import numpy as np # For numerical operations
 import json # For Read/write JSON data
+import csv
+import io
+import hashlib # Content hashes for caching resume vectors
 import logging # Records what happens during a run (errors, info)
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, replace
 from sklearn.feature_extraction.text import TfidfVectorizer # Term Frequency-Inverse Document Frequency Converts text to numerical vectors for similarity calculations 
-from sklearn.metrics.pairwise import cosine_similarity # Calculates similarity between vectors
-import spacy
-from collections import Counter
+from sklearn.base import clone
+import ahocorasick # Aho-Corasick automaton for matching all skills in a single pass
+from collections import Counter, OrderedDict
 import warnings
 import os
+import threading
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, lru_cache, cached_property
+from joblib import Memory # On-disk cache of parsed resume features
+
+try:
+    import orjson # Fast JSON encoder for result exports; the standard json module is the fallback
+except ImportError:
+    orjson = None
 
 warnings.filterwarnings('ignore') # Suppress warnings for cleaner output
 
@@ -29,6 +41,269 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns used on every resume are compiled once at import instead of per call.
+# Everything clean_text strips is fused into one alternation so the text is walked once.
+_CLEAN_RE = re.compile(
+    r'\S+@\S+'                        # Remove email addresses for privacy
+    r'|[\+]?[1-9]?[0-9]{7,15}'        # Remove phone numbers
+    r'|[^\w\s\-\.\,\(\)\@\#\%\&\+]'   # Keep alphanumeric, spaces, and common punctuation
+)
+
+@lru_cache(maxsize=200_000)
+def _clean_token(token: str) -> str:
+    """Clean one whitespace-delimited token; memoized since resumes share most of their vocabulary"""
+    return _CLEAN_RE.sub('', token).lower()
+
+# Every experience phrasing in one alternation; the name of the group that matched tells
+# which form was found, and finditer's matches never overlap so no phrase is counted twice
+_YEAR_RE = re.compile(
+    r'(?P<exp>\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)'         # "5 years of experience"
+    r'|(?P<field>\d+)\+?\s*years?\s*in\s+'                             # "5 years in [field]"
+    r'|(?:experience|exp)(?:\s*of\s*|\s+)(?P<exp_of>\d+)\+?\s*years?'  # "experience of 5 years"
+    r'|(?P<yrs>\d+)\+?\s*yr[s]?\s*(?:of\s*)?(?:experience|exp)'        # "5 yrs of exp"
+    r'|(?P<working>\d+)\+?\s*years?\s*(?:working|in\s+field)'          # "5 years working"
+    r'|\((?P<paren>\d+)\s*years?\)'                                    # "(7 years)"
+    r'|(?P<since>\d{4})\s*[-–]\s*(?:present|current)'                  # "2018-Present"
+    r'|(?P<plain>\d+)\s*years?',                                       # "7 years" standalone
+    re.IGNORECASE
+)
+
+# One alternation for every education keyword; the matching group name is the level
+_EDU_PATTERN = re.compile(
+    r'\b(?:(?P<phd>phd|ph\.d|doctorate|doctoral)'
+    r'|(?P<masters>masters|master|mba|ms|ma|msc|mtech|meng)'
+    r'|(?P<bachelors>bachelors|bachelor|bs|ba|bsc|btech|beng|degree)'
+    r'|(?P<diploma>diploma|certificate|associate))\b',
+    re.IGNORECASE
+)
+_EDUCATION_SCORES = {'phd': 5, 'masters': 4, 'bachelors': 3, 'diploma': 2}
+
+def _build_skill_automaton(skills: List[str]) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton that reports each skill found in a text"""
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+def _is_word_char(char: str) -> bool:
+    """Match the definition of a word character used by the regex \\b anchor"""
+    return char.isalnum() or char == '_'
+
+def _has_word_boundaries(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] does not run into a neighbouring word on either side.
+
+    Only an edge that is itself a word character needs a boundary, so 'java' is not found in
+    'javascript' while 'c++' and 'c#' still match when a space or punctuation follows them.
+    """
+    if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+# Skill database shared by every ranker instance. It is built once at import and frozen, so
+# forked workers share the pages copy-on-write and nothing can mutate it by accident.
+UNIVERSAL_SKILLS = MappingProxyType({
+    'ACCOUNTANT': ('financial analysis', 'tax preparation', 'auditing', 'budgeting', 'bookkeeping', 'payroll', 'gaap', 'ifrs', 'quickbooks', 'sap', 'excel', 'financial reporting'),
+    'ADVOCATE': ('legal research', 'litigation', 'contract law', 'negotiation', 'courtroom experience', 'client counseling', 'legal writing', 'case management', 'appellate practice'),
+    'AGRICULTURE': ('crop management', 'soil science', 'irrigation', 'pest control', 'farm management', 'agricultural economics', 'sustainability', 'organic farming', 'precision agriculture'),
+    'APPAREL': ('fashion design', 'textile knowledge', 'pattern making', 'sewing', 'merchandising', 'retail management', 'brand development', 'trend analysis', 'supply chain'),
+    'ARTS': ('graphic design', 'illustration', 'photography', 'art history', 'creative writing', 'performing arts', 'visual arts', 'art education', 'digital art'),
+    'AUTOMOBILE': ('mechanical engineering', 'auto repair', 'diagnostics', 'electrical systems', 'engine tuning', 'transmission', 'brake systems', 'automotive technology', 'cad'),
+    'AVIATION': ('piloting', 'aircraft maintenance', 'air traffic control', 'aviation safety', 'flight planning', 'navigation', 'aerodynamics', 'regulatory compliance', 'airport operations'),
+    'BANKING': ('financial services', 'credit analysis', 'risk management', 'investment banking', 'loan processing', 'customer service', 'compliance', 'fraud detection', 'treasury'),
+    'BPO': ('customer support', 'data entry', 'call center operations', 'process improvement', 'quality assurance', 'telemarketing', 'outsourcing', 'client management', 'crm'),
+    'BUSINESS-DEVELOPMENT': ('sales', 'market research', 'strategic planning', 'lead generation', 'client acquisition', 'partnership development', 'negotiation', 'crm', 'business intelligence'),
+    'CHEF': ('culinary arts', 'menu planning', 'food safety', 'kitchen management', 'recipe development', 'catering', 'baking', 'pastry', 'cost control'),
+    'CONSTRUCTION': ('project management', 'blueprint reading', 'safety regulations', 'heavy machinery operation', 'carpentry', 'plumbing', 'electrical work', 'masonry', 'estimating'),
+    'CONSULTANT': ('strategic consulting', 'problem-solving', 'data analysis', 'client relations', 'project management', 'industry expertise', 'report writing', 'presentation skills', 'change management'),
+    'DESIGNER': ('graphic design', 'ui/ux design', 'web design', 'branding', 'typography', 'adobe creative suite', 'prototyping', 'user research', 'wireframing'),
+    'DIGITAL-MEDIA': ('social media management', 'content creation', 'seo', 'sem', 'video editing', 'photography', 'copywriting', 'analytics', 'influencer marketing'),
+    'ENGINEERING': ('mechanical engineering', 'electrical engineering', 'civil engineering', 'software engineering', 'cad', 'matlab', 'project management', 'quality control', 'lean manufacturing'),
+    'FINANCE': ('financial modeling', 'investment analysis', 'portfolio management', 'risk assessment', 'financial reporting', 'budgeting', 'forecasting', 'bloomberg', 'derivatives'),
+    'FITNESS': ('personal training', 'group fitness instruction', 'nutrition', 'exercise physiology', 'client assessment', 'program design', 'motivation', 'safety', 'rehabilitation'),
+    'HEALTHCARE': ('patient care', 'medical terminology', 'emr', 'clinical skills', 'nursing', 'pharmacy', 'radiology', 'surgery', 'infection control'),
+    'HR': ('recruitment', 'employee relations', 'performance management', 'training', 'compensation', 'benefits', 'labor laws', 'hris', 'talent acquisition'),
+    'INFORMATION-TECHNOLOGY': ('programming', 'network administration', 'cybersecurity', 'database management', 'cloud computing', 'it support', 'software development', 'systems analysis', 'devops'),
+    'LEGAL': ('legal research', 'contract law', 'litigation', 'negotiation', 'compliance', 'case management', 'legal writing', 'client counseling', 'regulatory affairs'),
+    'MARKETING': ('digital marketing', 'content marketing', 'social media marketing', 'seo', 'sem', 'ppc', 'google analytics', 'brand management', 'market research', 'campaign management', 'copywriting', 'a/b testing', 'conversion optimization'),
+    'MEDICAL': ('patient care', 'medical terminology', 'clinical skills', 'diagnosis', 'treatment planning', 'emergency care', 'pharmacology', 'healthcare regulations', 'medical records'),
+    'NGO': ('project management', 'fundraising', 'community outreach', 'grant writing', 'advocacy', 'program evaluation', 'stakeholder engagement', 'volunteer management', 'impact measurement'),
+    'PHARMACEUTICAL': ('drug development', 'clinical trials', 'regulatory affairs', 'pharmacology', 'quality assurance', 'sales', 'marketing', 'research and development', 'gmp'),
+    'RESEARCH': ('data analysis', 'statistical methods', 'literature review', 'experimental design', 'report writing', 'research methodologies', 'fieldwork', 'academic publishing', 'peer review'),
+    'RETAIL': ('customer service', 'inventory management', 'sales', 'merchandising', 'visual display', 'point of sale systems', 'product knowledge', 'store operations', 'loss prevention'),
+    'PUBLIC-RELATIONS': ('media relations', 'press releases', 'event planning', 'crisis management', 'social media', 'content creation', 'brand management', 'stakeholder engagement', 'reputation management'),
+    'SALES': ('lead generation', 'customer relationship management', 'sales strategy', 'negotiation', 'product knowledge', 'closing deals', 'market analysis', 'cold calling', 'account management'),
+    'TEACHER': ('curriculum development', 'classroom management', 'lesson planning', 'student assessment', 'educational technology', 'special education', 'counseling', 'pedagogy', 'differentiated instruction'),
+    'TECHNICAL-SUPPORT': ('troubleshooting', 'customer service', 'hardware support', 'software installation', 'network troubleshooting', 'remote support', 'ticketing systems', 'technical documentation', 'escalation management'),
+    'TOURISM': ('customer service', 'itinerary planning', 'travel booking', 'cultural knowledge', 'event management', 'tour guiding', 'hospitality', 'sustainability', 'destination marketing'),
+    'TRANSPORTATION': ('logistics', 'supply chain management', 'fleet management', 'route planning', 'safety regulations', 'customer service', 'inventory management', 'transportation planning', 'warehouse management'),
+    'SOFT-SKILLS': ('communication', 'teamwork', 'problem-solving', 'time management', 'adaptability', 'creativity', 'work ethic', 'interpersonal skills', 'leadership', 'attention to detail', 'critical thinking')
+})
+
+# Precompile every skill into one automaton so a resume is scanned once, not once per skill
+_SKILL_VOCABULARY = frozenset(skill for skills in UNIVERSAL_SKILLS.values() for skill in skills)
+_SKILL_AUTOMATON = _build_skill_automaton(sorted(_SKILL_VOCABULARY))
+
+# Part of every feature-cache key, so editing the skills database retires old cache entries
+_SKILLS_DB_VERSION = hashlib.blake2b(repr(sorted(UNIVERSAL_SKILLS.items())).encode(), digest_size=8).hexdigest()
+
+# Part of every feature-cache key and text-cache entry. Bump it whenever clean_text or the skill,
+# experience, education or contact extraction changes, so results of the old code are never served
+_EXTRACTOR_VERSION = 1
+
+def _extract_features(file_path: Optional[str], mtime_ns: Optional[int], file_size: Optional[int],
+                      text_digest: Optional[str], skills_version: str, extractor_version: int, text: str,
+                      ranker: 'UniversalResumeRanker') -> Dict:
+    """Job-independent resume features; the leading arguments only form the disk-cache key"""
+    text_lower = text.lower()
+    return {
+        'text': ranker.clean_text(text),
+        'matched_skills': ranker._match_skills(text_lower, ranker._skill_automaton),
+        'experience_years': ranker.extract_experience_years(text, text_lower),
+        'education_score': ranker.extract_education(text, text_lower),
+        'contact_info': ranker.extract_contact_info(text)
+    }
+
+# Pages are always read serially: PyMuPDF documents are not thread-safe and get_text holds
+# the GIL, so parallelism comes from spreading whole files over processes instead.
+def _read_pages_streaming(doc: 'fitz.Document', max_chars: int) -> Tuple[str, int]:
+    """Stream pages into a UTF-8 buffer, stopping at the first page past the text cap"""
+    buffer = bytearray()
+    char_count = 0
+    for page_number, page in enumerate(doc, 1):
+        page_text = page.get_text("text")
+        buffer += page_text.encode('utf-8', errors='ignore')
+        char_count += len(page_text)
+        del page_text
+        if char_count > max_chars:
+            return buffer.decode('utf-8', errors='ignore'), page_number
+    return buffer.decode('utf-8', errors='ignore'), len(doc)
+
+# Column order of the detailed CSV export
+_DETAILED_EXPORT_FIELDS = (
+    'Rank', 'Filename', 'Sector', 'Overall_Score', 'Match_Percentage', 'Text_Similarity',
+    'Skill_Score', 'Experience_Score', 'Education_Score', 'Experience_Years', 'Education_Level',
+    'Skills_Count', 'All_Skills', 'Recommendations', 'File_Path'
+)
+
+# Bytes of the exports this process wrote most recently, keyed by absolute path, with the
+# (inode, mtime, size) the file had when written. Another gunicorn worker may rewrite the same
+# file, so the bytes are only served while the file on disk still has that identity
+_LAST_EXPORTS: Dict[str, Tuple[Tuple[int, int, int], bytes]] = {}
+
+def _file_identity(stat: os.stat_result) -> Tuple[int, int, int]:
+    """Identity of one version of a file; an atomic replace always yields a new inode"""
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+def _write_export(filename: str, payload: bytes):
+    """Replace an export file atomically and remember its bytes for downloads from this process"""
+    path = os.path.abspath(filename)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    # Stat before the rename, so a file another worker swaps in afterwards can never be mistaken for this one
+    identity = _file_identity(os.stat(tmp_path))
+    os.replace(tmp_path, path)
+    _LAST_EXPORTS[path] = (identity, payload)
+
+def _read_export(filename: str) -> Optional[bytes]:
+    """Bytes this process exported to filename, or None if it never did or the file has changed since"""
+    path = os.path.abspath(filename)
+    entry = _LAST_EXPORTS.get(path)
+    if entry is None:
+        return None
+    try:
+        current = _file_identity(os.stat(path))
+    except OSError:
+        return None
+    identity, payload = entry
+    return payload if current == identity else None
+
+# spaCy pipeline shared by every ranker in the process; loaded at most once, on first use
+_NLP = None
+_NLP_LOADED = False
+_NLP_LOCK = threading.Lock()
+
+def _get_nlp():
+    """Return the shared spaCy pipeline, loading it on the first call; None if it is unavailable"""
+    global _NLP, _NLP_LOADED
+    with _NLP_LOCK:
+        if not _NLP_LOADED:
+            try:
+                import spacy  # Imported here so workers and the regex-only path never pay for it
+                # Only tokenization and NER are used, so skip the heavier pipeline components
+                _NLP = spacy.load('en_core_web_sm', disable=['parser', 'tagger', 'lemmatizer'])
+                logger.info("SpaCy model loaded successfully")
+            except (ImportError, OSError):
+                logger.warning("SpaCy model not found. Install with: python -m spacy download en_core_web_sm")
+                _NLP = None
+            _NLP_LOADED = True
+    return _NLP
+
+def load_shared_models():
+    """Load the shared models up front, e.g. in a preforking server before its workers start"""
+    _get_nlp()
+
+def _pool_size_from_env() -> Optional[int]:
+    """RANKER_MAX_WORKERS as a positive int, or None (every core) when it is unset or invalid"""
+    value = os.environ.get('RANKER_MAX_WORKERS', '').strip()
+    if not value:
+        return None
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    logger.warning(f"Ignoring RANKER_MAX_WORKERS={value!r}: expected a positive integer")
+    return None
+
+# Ranker installed by _init_worker in each process-pool worker
+_worker_ranker = None
+
+def _init_worker(ranker: 'UniversalResumeRanker'):
+    """Process-pool initializer that hands the parent's ranker to the worker"""
+    global _worker_ranker
+    _worker_ranker = ranker
+
+def _parse_one(resume: 'ResumeData', job_skills: Optional[Dict] = None,
+               ranker: Optional['UniversalResumeRanker'] = None) -> Optional[Dict]:
+    """Parse one resume; module-level so it can be dispatched to a process pool"""
+    ranker = ranker or _worker_ranker
+    try:
+        parsed = ranker.parse_resume(
+            resume.text, 
+            resume.filename, 
+            job_skills,
+            getattr(resume, 'file_path', None)
+        )
+        parsed['sector'] = resume.sector
+        return parsed
+    except Exception as e:
+        logger.error(f"Error processing resume {resume.filename}: {e}")
+        return None
+
+def _process_one_pdf(entry: Tuple[str, int], ranker: Optional['UniversalResumeRanker'] = None) -> Optional['ResumeData']:
+    """Extract and clean one (path, size) PDF entry; module-level so folder ingestion can use a process pool"""
+    ranker = ranker or _worker_ranker
+    file_path = Path(entry[0])
+    try:
+        loaded = ranker._load_resume_text(file_path, entry[1])
+        if loaded is None:
+            return None
+        cleaned_text, content_hash, file_size = loaded
+        
+        return ResumeData(
+            filename=file_path.name,
+            sector="General",  # or infer if you want
+            text=cleaned_text,
+            file_path=str(file_path),
+            file_size=file_size,
+            processing_time=None,  # optional
+            content_hash=content_hash
+        )
+    except Exception as e:
+        logger.warning(f"Failed to process {file_path}: {e}")
+        return None
+
 @dataclass
 class ResumeData:
     """Data class for resume information"""
@@ -38,6 +313,7 @@ class ResumeData:
     file_path: Optional[str] = None
     file_size: Optional[int] = None
     processing_time: Optional[float] = None
+    content_hash: Optional[str] = None  # BLAKE2b of the PDF bytes, set by process_resume_folder
 
 @dataclass
 class RankingResult:
@@ -59,6 +335,30 @@ class RankingResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return asdict(self)
+    
+    # Derived views are computed on first use and kept; results are not mutated after ranking
+    @cached_property
+    def flat_skills(self) -> Tuple[str, ...]:
+        """Every skill found, across all categories, in category order"""
+        return tuple(skill for skills in self.skills_found.values() for skill in skills)
+    
+    @cached_property
+    def strengths(self) -> Tuple[str, ...]:
+        """Candidate strengths based on scores"""
+        strengths = []
+        
+        if self.skill_score > 0.7:
+            strengths.append("Strong skill match")
+        if self.experience_score > 0.8:
+            strengths.append("Excellent experience level")
+        if self.education_score > 0.8:
+            strengths.append("Strong educational background")
+        if self.text_similarity > 0.6:
+            strengths.append("High content relevance")
+        if self.match_percentage > 85:
+            strengths.append("Exceptional overall match")
+        
+        return tuple(strengths)
 
 @dataclass
 class JobAnalysis:
@@ -69,6 +369,7 @@ class JobAnalysis:
     sector_detected: str
     key_requirements: List[str]
     complexity_score: float
+    entities: Dict[str, List[str]] = field(default_factory=dict)  # Only filled by the deep analysis
 
 class UniversalResumeRanker:
     def __init__(self, config: Optional[Dict] = None):
@@ -78,6 +379,7 @@ class UniversalResumeRanker:
         self._initialize_nlp()
         self._initialize_vectorizer()
         self._initialize_skills_database()
+        self._initialize_feature_cache()
         logger.info("Resume Ranker initialized successfully")
 
     def _get_default_config(self) -> Dict:
@@ -93,79 +395,157 @@ class UniversalResumeRanker:
             'experience_weight': 0.2,
             'education_weight': 0.15,
             'enable_caching': True,
-            'max_file_size_mb': 10
+            'cache_dir': '.cache/resume_ranker',  # Parsed resume features persist here between runs
+            'cache_max_mb': 512,  # Each on-disk cache is trimmed back under this size when a ranker starts
+            'job_cache_size': 64,  # Job descriptions whose analysis is kept in memory
+            'result_cache_size': 32,  # API responses kept for repeat requests over an unchanged folder
+            'max_file_size_mb': 10,
+            'max_text_chars': 200_000,  # Stop extracting PDF pages once this much text is collected
+            'parallel_threshold': 32,  # Batches smaller than this are processed in-process
+            'max_workers': _pool_size_from_env(),  # Process-pool size, None uses every core
+            'spacy_batch_size': 64,
+            'lazy_spacy': True,  # Ingest uses regex only; load spaCy on the first query that needs it
+            'dense_min_rows': 1000,  # Densify the resume matrix for BLAS scoring above this many rows
+            'dense_min_density': 0.05,  # ...or when this fraction of entries is non-zero
+            'dense_max_mb': 256  # Never densify past this much memory
         }
 
     def _initialize_nlp(self):
-        """Initialize NLP model with error handling"""
-        try:
-            self.nlp = spacy.load('en_core_web_sm')
-            logger.info("SpaCy model loaded successfully")
-        except OSError:
-            logger.warning("SpaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        """Initialize NLP model, deferring the load until first use when lazy_spacy is set"""
+        self._nlp = None
+        self._nlp_loaded = False
+        if not self.config.get('lazy_spacy', True):
+            self._load_nlp()
+
+    def _load_nlp(self):
+        """Attach the process-wide spaCy pipeline, loading it if no ranker has yet"""
+        self._nlp = _get_nlp()
+        self._nlp_loaded = True
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first access"""
+        if not self._nlp_loaded:
+            self._load_nlp()
+        return self._nlp
+
+    def batch_nlp(self, texts: List[str]) -> List:
+        """Run the spaCy pipeline over many texts at once; use this for any NER over resumes"""
+        if self.nlp is None or not texts:
+            return []
+        
+        batch_size = self.config.get('spacy_batch_size', 64)
+        # Worker processes only pay off once there is more than one batch to share out
+        n_process = max(1, (os.cpu_count() or 1) // 2) if len(texts) > batch_size else 1
+        return list(self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process))
 
     def _initialize_vectorizer(self):
-        """Initialize TF-IDF vectorizer"""
+        """Initialize the TF-IDF vectorizer template; each corpus is fitted on its own clone"""
         self.vectorizer = TfidfVectorizer(
             max_features=self.config['max_features'],
             stop_words='english',
             ngram_range=self.config['ngram_range'],
             lowercase=True,
-            min_df=self.config['min_df']
+            min_df=self.config['min_df'],
+            norm='l2',  # Rows come out unit length, so cosine similarity is a plain dot product
+            dtype=np.float32  # Half the memory of float64 vectors; far more precision than TF-IDF weights need
         )
+        # Last fitted corpus as one (vectorizer, matrix, keys, row index) tuple, reused across job
+        # descriptions while the set of resume texts is unchanged. It is replaced whole, never mutated, so a
+        # request scoring it never sees the vocabulary of a corpus another thread fitted meanwhile
+        self._corpus: Optional[Tuple[TfidfVectorizer, Any, List[str], Dict[str, int]]] = None
 
     def _initialize_skills_database(self):
         """Initialize comprehensive skills database"""
-        self.universal_skills = {
-            'ACCOUNTANT': ['financial analysis', 'tax preparation', 'auditing', 'budgeting', 'bookkeeping', 'payroll', 'gaap', 'ifrs', 'quickbooks', 'sap', 'excel', 'financial reporting'],
-            'ADVOCATE': ['legal research', 'litigation', 'contract law', 'negotiation', 'courtroom experience', 'client counseling', 'legal writing', 'case management', 'appellate practice'],
-            'AGRICULTURE': ['crop management', 'soil science', 'irrigation', 'pest control', 'farm management', 'agricultural economics', 'sustainability', 'organic farming', 'precision agriculture'],
-            'APPAREL': ['fashion design', 'textile knowledge', 'pattern making', 'sewing', 'merchandising', 'retail management', 'brand development', 'trend analysis', 'supply chain'],
-            'ARTS': ['graphic design', 'illustration', 'photography', 'art history', 'creative writing', 'performing arts', 'visual arts', 'art education', 'digital art'],
-            'AUTOMOBILE': ['mechanical engineering', 'auto repair', 'diagnostics', 'electrical systems', 'engine tuning', 'transmission', 'brake systems', 'automotive technology', 'cad'],
-            'AVIATION': ['piloting', 'aircraft maintenance', 'air traffic control', 'aviation safety', 'flight planning', 'navigation', 'aerodynamics', 'regulatory compliance', 'airport operations'],
-            'BANKING': ['financial services', 'credit analysis', 'risk management', 'investment banking', 'loan processing', 'customer service', 'compliance', 'fraud detection', 'treasury'],
-            'BPO': ['customer support', 'data entry', 'call center operations', 'process improvement', 'quality assurance', 'telemarketing', 'outsourcing', 'client management', 'crm'],
-            'BUSINESS-DEVELOPMENT': ['sales', 'market research', 'strategic planning', 'lead generation', 'client acquisition', 'partnership development', 'negotiation', 'crm', 'business intelligence'],
-            'CHEF': ['culinary arts', 'menu planning', 'food safety', 'kitchen management', 'recipe development', 'catering', 'baking', 'pastry', 'cost control'],
-            'CONSTRUCTION': ['project management', 'blueprint reading', 'safety regulations', 'heavy machinery operation', 'carpentry', 'plumbing', 'electrical work', 'masonry', 'estimating'],
-            'CONSULTANT': ['strategic consulting', 'problem-solving', 'data analysis', 'client relations', 'project management', 'industry expertise', 'report writing', 'presentation skills', 'change management'],
-            'DESIGNER': ['graphic design', 'ui/ux design', 'web design', 'branding', 'typography', 'adobe creative suite', 'prototyping', 'user research', 'wireframing'],
-            'DIGITAL-MEDIA': ['social media management', 'content creation', 'seo', 'sem', 'video editing', 'photography', 'copywriting', 'analytics', 'influencer marketing'],
-            'ENGINEERING': ['mechanical engineering', 'electrical engineering', 'civil engineering', 'software engineering', 'cad', 'matlab', 'project management', 'quality control', 'lean manufacturing'],
-            'FINANCE': ['financial modeling', 'investment analysis', 'portfolio management', 'risk assessment', 'financial reporting', 'budgeting', 'forecasting', 'bloomberg', 'derivatives'],
-            'FITNESS': ['personal training', 'group fitness instruction', 'nutrition', 'exercise physiology', 'client assessment', 'program design', 'motivation', 'safety', 'rehabilitation'],
-            'HEALTHCARE': ['patient care', 'medical terminology', 'emr', 'clinical skills', 'nursing', 'pharmacy', 'radiology', 'surgery', 'infection control'],
-            'HR': ['recruitment', 'employee relations', 'performance management', 'training', 'compensation', 'benefits', 'labor laws', 'hris', 'talent acquisition'],
-            'INFORMATION-TECHNOLOGY': ['programming', 'network administration', 'cybersecurity', 'database management', 'cloud computing', 'it support', 'software development', 'systems analysis', 'devops'],
-            'LEGAL': ['legal research', 'contract law', 'litigation', 'negotiation', 'compliance', 'case management', 'legal writing', 'client counseling', 'regulatory affairs'],
-            'MARKETING': ['digital marketing', 'content marketing', 'social media marketing', 'seo', 'sem', 'ppc', 'google analytics', 'brand management', 'market research', 'campaign management', 'copywriting', 'a/b testing', 'conversion optimization'],
-            'MEDICAL': ['patient care', 'medical terminology', 'clinical skills', 'diagnosis', 'treatment planning', 'emergency care', 'pharmacology', 'healthcare regulations', 'medical records'],
-            'NGO': ['project management', 'fundraising', 'community outreach', 'grant writing', 'advocacy', 'program evaluation', 'stakeholder engagement', 'volunteer management', 'impact measurement'],
-            'PHARMACEUTICAL': ['drug development', 'clinical trials', 'regulatory affairs', 'pharmacology', 'quality assurance', 'sales', 'marketing', 'research and development', 'gmp'],
-            'RESEARCH': ['data analysis', 'statistical methods', 'literature review', 'experimental design', 'report writing', 'research methodologies', 'fieldwork', 'academic publishing', 'peer review'],
-            'RETAIL': ['customer service', 'inventory management', 'sales', 'merchandising', 'visual display', 'point of sale systems', 'product knowledge', 'store operations', 'loss prevention'],
-            'PUBLIC-RELATIONS': ['media relations', 'press releases', 'event planning', 'crisis management', 'social media', 'content creation', 'brand management', 'stakeholder engagement', 'reputation management'],
-            'SALES': ['lead generation', 'customer relationship management', 'sales strategy', 'negotiation', 'product knowledge', 'closing deals', 'market analysis', 'cold calling', 'account management'],
-            'TEACHER': ['curriculum development', 'classroom management', 'lesson planning', 'student assessment', 'educational technology', 'special education', 'counseling', 'pedagogy', 'differentiated instruction'],
-            'TECHNICAL-SUPPORT': ['troubleshooting', 'customer service', 'hardware support', 'software installation', 'network troubleshooting', 'remote support', 'ticketing systems', 'technical documentation', 'escalation management'],
-            'TOURISM': ['customer service', 'itinerary planning', 'travel booking', 'cultural knowledge', 'event management', 'tour guiding', 'hospitality', 'sustainability', 'destination marketing'],
-            'TRANSPORTATION': ['logistics', 'supply chain management', 'fleet management', 'route planning', 'safety regulations', 'customer service', 'inventory management', 'transportation planning', 'warehouse management'],
-            'SOFT-SKILLS': ['communication', 'teamwork', 'problem-solving', 'time management', 'adaptability', 'creativity', 'work ethic', 'interpersonal skills', 'leadership', 'attention to detail', 'critical thinking']
-        }
+        self.universal_skills = UNIVERSAL_SKILLS
+        self._skill_vocabulary = _SKILL_VOCABULARY
+        self._skill_automaton = _SKILL_AUTOMATON
+
+    def _initialize_feature_cache(self):
+        """Initialize the job-analysis cache and the on-disk caches of resume text and features"""
+        # Most recently used job analyses, keyed by a digest of the exact job description text
+        self._job_cache: 'OrderedDict[bytes, JobAnalysis]' = OrderedDict()
+        self._job_cache_lock = threading.Lock()  # Server threads share the ranker and its LRU order
+        self._feature_cache = None
+        self._text_cache_dir = None
+        cache_dir = self.config.get('cache_dir', '.cache/resume_ranker')
+        if self.config['enable_caching'] and cache_dir:
+            # One small JSON file per PDF content hash, so pool workers never contend on a shared index
+            self._text_cache_dir = Path(cache_dir) / 'text'
+            # The text itself is keyed by its digest, so the large string is not hashed again by joblib
+            memory = Memory(cache_dir, verbose=0)
+            self._feature_cache = memory.cache(_extract_features, ignore=['text', 'ranker'])
+            # Both caches only ever grow, so drop their least recently used entries past the limit
+            limit_bytes = int(self.config.get('cache_max_mb', 512) * 1024 * 1024)
+            try:
+                memory.reduce_size(bytes_limit=limit_bytes)
+            except Exception as e:
+                logger.warning(f"Could not trim the feature cache in {cache_dir}: {e}")
+            self._trim_text_cache(limit_bytes)
+
+    def _trim_text_cache(self, limit_bytes: int):
+        """Delete the oldest text-cache entries until the folder fits in limit_bytes"""
+        files = []
+        try:
+            with os.scandir(self._text_cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json'):
+                        stat = entry.stat()
+                        files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return  # No cache folder yet
+        
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= limit_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+    def __getstate__(self):
+        """Pickle only the configuration-sized state pool workers need, not the shared models or caches"""
+        state = self.__dict__.copy()
+        for key in ('universal_skills', '_skill_vocabulary', '_skill_automaton', '_job_cache_lock'):
+            state.pop(key, None)
+        # Workers attach their own process's shared pipeline if they ever need it
+        state['_nlp'] = None
+        state['_nlp_loaded'] = False
+        # Workers only extract and parse resumes; the fitted corpus and job analyses stay in the parent
+        state['_corpus'] = None
+        state['_job_cache'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled ranker and reattach the module-level skill database"""
+        self.__dict__.update(state)
+        self._initialize_skills_database()
+        self._job_cache_lock = threading.Lock()
 
     def analyze_job_description(self, job_description: str) -> JobAnalysis:
-        """Analyze job description and extract key requirements"""
+        """Analyze job description and extract key requirements, reusing the analysis of a repeated one"""
+        cache_key = None
+        if self.config['enable_caching']:
+            # Exact text, not case-folded: key_requirements keep the original wording
+            cache_key = hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).digest()
+            with self._job_cache_lock:
+                cached = self._job_cache.get(cache_key)
+                if cached is not None:
+                    self._job_cache.move_to_end(cache_key)
+                    return cached
+        
         try:
-            skills = self.extract_dynamic_skills(job_description)
-            experience = self.extract_experience_years(job_description)
-            education = self.extract_education(job_description)
-            sector = self._detect_sector(job_description)
+            text_lower = job_description.lower()
+            skills = self.extract_dynamic_skills(job_description, text_lower=text_lower)
+            experience = self.extract_experience_years(job_description, text_lower)
+            education = self.extract_education(job_description, text_lower)
+            sector = self._detect_sector(job_description, skills)
             requirements = self._extract_key_requirements(job_description)
             complexity = self._calculate_complexity_score(skills, experience, education)
             
-            return JobAnalysis(
+            job_analysis = JobAnalysis(
                 skills_required=skills,
                 experience_required=experience,
                 education_required=education,
@@ -176,18 +556,39 @@ class UniversalResumeRanker:
         except Exception as e:
             logger.error(f"Error analyzing job description: {e}")
             raise
+        
+        if cache_key is not None:
+            with self._job_cache_lock:
+                self._job_cache[cache_key] = job_analysis
+                while len(self._job_cache) > self.config.get('job_cache_size', 64):
+                    self._job_cache.popitem(last=False)
+        return job_analysis
+
+    def analyze_job_description_deep(self, job_description: str) -> JobAnalysis:
+        """Analyze a job description and add spaCy named entities to the regex-based analysis"""
+        # A copy, so the cached regex analysis never carries entities
+        return replace(self.analyze_job_description(job_description),
+                       entities=self.extract_entities(job_description))
 
-    def _detect_sector(self, text: str) -> str:
+    def extract_entities(self, text: str) -> Dict[str, List[str]]:
+        """Query-time entity extraction with spaCy; resume ingest never calls this"""
+        entities = {}
+        for doc in self.batch_nlp([text]):
+            for ent in doc.ents:
+                label_entities = entities.setdefault(ent.label_, [])
+                if ent.text not in label_entities:
+                    label_entities.append(ent.text)
+        return entities
+
+    def _detect_sector(self, text: str, skills: Optional[Dict[str, List[str]]] = None) -> str:
         """Detect the most likely sector from job description"""
-        text_lower = text.lower()
-        sector_scores = {}
-        
-        for sector, skills in self.universal_skills.items():
-            if sector == 'SOFT-SKILLS':
-                continue
-            score = sum(1 for skill in skills if skill in text_lower)
-            if score > 0:
-                sector_scores[sector] = score
+        # Reuse the single automaton pass instead of scanning the text once per skill
+        if skills is None:
+            skills = self.extract_dynamic_skills(text)
+        sector_scores = {
+            sector: len(found) for sector, found in skills.items()
+            if sector != 'SOFT-SKILLS' and found
+        }
         
         return max(sector_scores.items(), key=lambda x: x[1])[0] if sector_scores else 'GENERAL'
 
@@ -214,19 +615,28 @@ class UniversalResumeRanker:
         complexity = (skill_count * 0.4 + experience * 0.4 + education * 0.2) / 20
         return min(complexity, 1.0)
 
-    def extract_text_from_pdf(self, pdf_path: Path) -> Tuple[str, Dict]:
-        """Extract text from PDF file with metadata"""
+    def extract_text_from_pdf(self, pdf_path: Path, data: Optional[bytes] = None) -> Tuple[str, Dict]:
+        """Extract text from PDF file with metadata, reading from data instead when the bytes are in hand"""
         try:
             start_time = datetime.now()
-            text = ""
-            metadata = {}
+            metadata = {'file_size': len(data) if data is not None else pdf_path.stat().st_size}
+            
+            max_bytes = self.config['max_file_size_mb'] * 1024 * 1024
+            if metadata['file_size'] > max_bytes:
+                logger.warning(f"Skipping {pdf_path.name}: {metadata['file_size']} bytes exceeds "
+                               f"the {self.config['max_file_size_mb']} MB limit")
+                return "", {}
             
-            with fitz.open(pdf_path) as doc:
-                metadata['page_count'] = len(doc)
-                metadata['file_size'] = pdf_path.stat().st_size
-                
-                for page in doc:
-                    text += page.get_text()
+            # Opening only reads the page tree; text is then pulled a page at a time up to the cap
+            max_chars = self.config.get('max_text_chars', 200_000)
+            document = fitz.open(stream=data, filetype='pdf') if data is not None else fitz.open(pdf_path, filetype='pdf')
+            with document as doc:
+                page_count = metadata['page_count'] = doc.page_count
+                text, pages_read = _read_pages_streaming(doc, max_chars)
+            if pages_read < page_count:
+                logger.warning(f"Truncated {pdf_path.name} after page {pages_read} of "
+                               f"{page_count}: extracted text exceeds {max_chars} characters")
+                metadata['truncated'] = True
             
             processing_time = (datetime.now() - start_time).total_seconds()
             metadata['processing_time'] = processing_time
@@ -238,97 +648,138 @@ class UniversalResumeRanker:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             return "", {}
 
+    def _load_resume_text(self, file_path: Path, file_size: Optional[int] = None) -> Optional[Tuple[str, Optional[str], int]]:
+        """Extract and clean a PDF's text, reusing the cached copy for byte-identical files; None if it is too large"""
+        if file_size is None:
+            file_size = file_path.stat().st_size
+        if file_size > self.config['max_file_size_mb'] * 1024 * 1024:
+            # Never read an oversized file in; an empty resume would still be ranked on its default scores
+            logger.warning(f"Skipping {file_path.name}: {file_size} bytes exceeds "
+                           f"the {self.config['max_file_size_mb']} MB limit")
+            return None
+        
+        data = file_path.read_bytes()
+        content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+        cached_text = self._read_text_cache(content_hash)
+        if cached_text is not None:
+            return cached_text, content_hash, file_size
+        
+        text, metadata = self.extract_text_from_pdf(file_path, data)
+        cleaned_text = self.clean_text(text)
+        if metadata:  # Empty metadata means extraction failed; let the next run retry
+            self._write_text_cache(content_hash, cleaned_text, metadata)
+        return cleaned_text, content_hash, file_size
+
+    def _read_text_cache(self, content_hash: str) -> Optional[str]:
+        """Return the cached cleaned text for a content hash, or None on a miss"""
+        if self._text_cache_dir is None:
+            return None
+        try:
+            with open(self._text_cache_dir / f"{content_hash}.json", encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Entries extracted under a different text cap or by older cleaning code are stale
+        if (entry.get('max_text_chars') != self.config.get('max_text_chars', 200_000)
+                or entry.get('extractor_version') != _EXTRACTOR_VERSION):
+            return None
+        return entry.get('text')
+
+    def _write_text_cache(self, content_hash: str, cleaned_text: str, metadata: Dict):
+        """Store cleaned text under its content hash, replacing the file atomically"""
+        if self._text_cache_dir is None:
+            return
+        try:
+            self._text_cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._text_cache_dir / f"{content_hash}.json"
+            # Unique per process and thread, so two server threads caching the same PDF never share a temp file
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            entry = {
+                'text': cleaned_text,
+                'metadata': metadata,
+                'max_text_chars': self.config.get('max_text_chars', 200_000),
+                'extractor_version': _EXTRACTOR_VERSION
+            }
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not cache extracted text {content_hash}: {e}")
+
     def clean_text(self, text: str) -> str:
         """Clean and preprocess text with enhanced cleaning"""
         if not text:
             return ""
         
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text)
-        # Keep alphanumeric, spaces, and common punctuation
-        text = re.sub(r'[^\w\s\-\.\,\(\)\@\#\%\&\+]', '', text)
-        # Remove email addresses for privacy
-        text = re.sub(r'\S+@\S+', '', text)
-        # Remove phone numbers
-        text = re.sub(r'[\+]?[1-9]?[0-9]{7,15}', '', text)
-        
-        return text.lower().strip()
+        # No pattern in _CLEAN_RE spans whitespace, so cleaning token by token gives the same result
+        # as cleaning the whole text; tokens that are stripped away entirely are dropped
+        return ' '.join(filter(None, map(_clean_token, text.split())))
 
-    def extract_dynamic_skills(self, text: str, reference_skills: Optional[Dict] = None) -> Dict[str, List[str]]:
-        """Extract skills dynamically with improved matching"""
+    def extract_dynamic_skills(self, text: str, reference_skills: Optional[Dict] = None,
+                               text_lower: Optional[str] = None,
+                               matched: Optional[set] = None) -> Dict[str, List[str]]:
+        """Extract skills dynamically with a single Aho-Corasick pass over the text"""
         if not text:
             return {}
         
-        text_lower = text.lower()
-        found_skills = {}
         skills_to_search = reference_skills or self.universal_skills
         
+        if matched is None:
+            if text_lower is None:
+                text_lower = text.lower()
+            matched = self._match_skills(text_lower, self._skill_automaton)
+        else:
+            matched = set(matched)
+        
+        # Custom reference skills outside the universal database get a small per-call automaton
+        extra_skills = {
+            skill for skills in skills_to_search.values() for skill in skills
+        } - self._skill_vocabulary
+        if extra_skills:
+            if text_lower is None:
+                text_lower = text.lower()
+            matched |= self._match_skills(text_lower, _build_skill_automaton(sorted(extra_skills)))
+        
+        found_skills = {}
         for category, skills in skills_to_search.items():
-            category_skills = []
-            for skill in skills:
-                # Exact match or word boundary match
-                if skill in text_lower or re.search(rf'\b{re.escape(skill)}\b', text_lower):
-                    category_skills.append(skill)
-            
+            category_skills = [skill for skill in skills if skill in matched]
             if category_skills:
                 found_skills[category] = category_skills
         
         return found_skills
 
-    def extract_experience_years(self, text: str) -> int:
+    def _match_skills(self, text_lower: str, automaton: ahocorasick.Automaton) -> set:
+        """Return the skills from the automaton that occur in the text on word boundaries"""
+        matched = set()
+        for end, skill in automaton.iter(text_lower):
+            if skill in matched:
+                continue
+            start = end - len(skill) + 1
+            if _has_word_boundaries(text_lower, start, end + 1):
+                matched.add(skill)
+        return matched
+
+    def extract_experience_years(self, text: str, text_lower: Optional[str] = None) -> int:
         """Extract and sum years of experience from text with enhanced patterns"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',  # "5 years of experience"
-            r'(\d+)\+?\s*years?\s*in\s+',                         # "5 years in [field]"
-            r'(?:experience|exp)(?:\s*of\s*|\s+)(\d+)\+?\s*years?', # "experience of 5 years"
-            r'(\d+)\+?\s*yr[s]?\s*(?:of\s*)?(?:experience|exp)',  # "5 yrs of exp"
-            r'(\d+)\+?\s*years?\s*(?:working|in\s+field)',        # "5 years working"
-            r'\((\d+)\s*years?\)',                                # "(7 years)"
-            r'(\d+)\s*years?',                                    # "7 years" standalone
-            r'(\d{4})\s*[-–]\s*(?:present|current)',             # "2018-Present"
-        ]
+        current_year = 2025 #datetime.now().year  
+        total_years = 0
         
-        years = []
-        text_lower = text.lower()
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                if pattern.endswith('present|current)'):  # Handle "2018-Present"
-                    start_year = int(match)
-                    current_year = 2025 #datetime.now().year  
-                    years.append(current_year - start_year)
-                else:
-                    years.append(int(match))
+        if text_lower is None:
+            text_lower = text.lower()
+        for match in _YEAR_RE.finditer(text_lower):
+            if match.lastgroup == 'since':  # Handle "2018-Present"
+                total_years += current_year - int(match['since'])
+            else:
+                total_years += int(match[match.lastgroup])
         
-        # Sum unique years, avoiding double-counting overlapping phrases
-        if years:
-            # Group by approximate value to avoid summing redundant matches
-            year_counts = Counter(years)
-            total_years = sum(year for year in set(years))
-            return min(total_years, 50)  # Cap at 50 years to avoid outliers
-        return 0
+        return min(total_years, 50)  # Cap at 50 years to avoid outliers
 
-    def extract_education(self, text: str) -> int:
+    def extract_education(self, text: str, text_lower: Optional[str] = None) -> int:
         """Extract education information with enhanced detection"""
-        education_keywords = {
-            'phd': ['phd', 'ph.d', 'doctorate', 'doctoral'],
-            'masters': ['masters', 'master', 'mba', 'ms', 'ma', 'msc', 'mtech', 'meng'],
-            'bachelors': ['bachelors', 'bachelor', 'bs', 'ba', 'bsc', 'btech', 'beng', 'degree'],
-            'diploma': ['diploma', 'certificate', 'associate']
-        }
-        
-        text_lower = text.lower()
-        found_education = []
-        
-        for level, keywords in education_keywords.items():
-            for keyword in keywords:
-                if re.search(rf'\b{keyword}\b', text_lower):
-                    found_education.append(level)
-                    break
-        
-        education_scores = {'phd': 5, 'masters': 4, 'bachelors': 3, 'diploma': 2}
-        return max(education_scores.get(edu, 1) for edu in found_education) if found_education else 1
+        if text_lower is None:
+            text_lower = text.lower()
+        found_education = {match.lastgroup for match in _EDU_PATTERN.finditer(text_lower)}
+        return max(_EDUCATION_SCORES[edu] for edu in found_education) if found_education else 1
 
     def extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information (for display purposes only)"""
@@ -350,23 +801,21 @@ class UniversalResumeRanker:
 
     def parse_resume(self, resume_text: str, filename: str, job_skills: Optional[Dict] = None, 
                     file_path: Optional[str] = None) -> Dict:
-        """Parse resume and extract structured information"""
+        """Parse resume and extract structured information using the fast regex extractors only"""
         try:
-            cleaned_text = self.clean_text(resume_text)
-            skills = self.extract_dynamic_skills(resume_text, job_skills)
-            experience = self.extract_experience_years(resume_text)
-            education = self.extract_education(resume_text)
-            contact_info = self.extract_contact_info(resume_text)
+            features = self._resume_features(resume_text, file_path)
+            skills = self.extract_dynamic_skills(resume_text, job_skills, matched=features['matched_skills'])
             
             return {
                 'filename': filename,
                 'file_path': file_path,
-                'text': cleaned_text,
+                'text': features['text'],
                 'raw_text': resume_text,  # Keep raw text for detailed analysis
                 'skills': skills,
-                'experience_years': experience,
-                'education_score': education,
-                'contact_info': contact_info,
+                'skill_sets': {category: frozenset(found) for category, found in skills.items()},
+                'experience_years': features['experience_years'],
+                'education_score': features['education_score'],
+                'contact_info': features['contact_info'],
                 'word_count': len(resume_text.split()),
                 'character_count': len(resume_text)
             }
@@ -374,39 +823,112 @@ class UniversalResumeRanker:
             logger.error(f"Error parsing resume {filename}: {e}")
             raise
 
+    def _resume_features(self, resume_text: str, file_path: Optional[str] = None) -> Dict:
+        """Job-independent features of a resume, read from the disk cache while its file is unchanged"""
+        if self._feature_cache is not None and file_path:
+            try:
+                stat = os.stat(file_path)
+                text_digest = hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).hexdigest()
+                return self._feature_cache(str(file_path), stat.st_mtime_ns, stat.st_size, text_digest,
+                                           _SKILLS_DB_VERSION, _EXTRACTOR_VERSION, resume_text, self)
+            except Exception as e:
+                logger.warning(f"Feature cache unavailable for {file_path}: {e}")
+        
+        return _extract_features(None, None, None, None, _SKILLS_DB_VERSION, _EXTRACTOR_VERSION, resume_text, self)
+
     def calculate_text_similarity(self, job_description: str, resume_texts: List[str]) -> np.ndarray:
         """Calculate TF-IDF similarity with error handling"""
         if not resume_texts:
             return np.array([])
         
-        all_texts = [job_description] + resume_texts
         try:
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
-            job_vector = tfidf_matrix[0:1]
-            resume_vectors = tfidf_matrix[1:]
-            similarities = cosine_similarity(job_vector, resume_vectors).flatten()
-            return similarities
+            if len(resume_texts) >= self.config['min_df']:
+                try:
+                    vectorizer, resume_matrix = self._fit_corpus(resume_texts)
+                except ValueError:
+                    # The resumes alone share too few terms to survive min_df pruning
+                    logger.debug("Resume corpus too small for its own vocabulary, fitting with the job description")
+                else:
+                    return self._score(job_description, vectorizer, resume_matrix)
+            
+            # Too few resumes to build a vocabulary on their own, so fit a throwaway
+            # vectorizer with the job description included and keep the cached fit intact
+            tfidf_matrix = clone(self.vectorizer).fit_transform([job_description] + resume_texts)
+            return (tfidf_matrix[1:] @ tfidf_matrix[0:1].T).toarray().ravel().astype(np.float64)
         except Exception as e:
             logger.error(f"Error calculating text similarity: {e}")
             return np.zeros(len(resume_texts))
 
-    def calculate_advanced_skill_match(self, job_skills: Dict, resume_skills: Dict) -> Tuple[float, Dict]:
+    def _fit_corpus(self, resume_texts: List[str]) -> Tuple[TfidfVectorizer, Any]:
+        """Fit a vectorizer on the resume corpus and return it with the matrix, reusing the cached fit for the same corpus"""
+        keys = [hashlib.sha1(text.encode('utf-8')).hexdigest() for text in resume_texts]
+        
+        corpus = self._corpus  # Read once; the vectorizer and matrix must come from the same fit
+        if self.config['enable_caching'] and corpus is not None:
+            vectorizer, resume_matrix, cached_keys, row_index = corpus
+            # The same corpus in the same order is scored against the cached matrix as it is
+            if keys == cached_keys:
+                return vectorizer, resume_matrix
+            # A reordering of the same texts has the same vocabulary and IDF, so only the rows move.
+            # A subset is refitted: scores must not depend on what this process ranked before
+            if sorted(keys) == sorted(cached_keys):
+                return vectorizer, resume_matrix[[row_index[key] for key in keys]]
+        
+        vectorizer = clone(self.vectorizer)
+        resume_matrix = self._choose_layout(vectorizer.fit_transform(resume_texts))
+        if self.config['enable_caching']:
+            self._corpus = (vectorizer, resume_matrix, keys, {key: i for i, key in enumerate(keys)})
+        return vectorizer, resume_matrix
+
+    def _choose_layout(self, resume_matrix):
+        """Keep sparse TF-IDF rows, or densify large/dense corpora so scoring runs as a BLAS gemv"""
+        rows, cols = resume_matrix.shape
+        if not rows or not cols:
+            return resume_matrix
+        
+        density = resume_matrix.nnz / (rows * cols)
+        dense_mb = rows * cols * np.dtype(np.float32).itemsize / (1024 * 1024)
+        wants_dense = (rows > self.config.get('dense_min_rows', 1000)
+                       or density > self.config.get('dense_min_density', 0.05))
+        if wants_dense and dense_mb <= self.config.get('dense_max_mb', 256):
+            return resume_matrix.astype(np.float32, copy=False).toarray()
+        return resume_matrix
+
+    def _score(self, job_text: str, vectorizer: TfidfVectorizer, resume_matrix) -> np.ndarray:
+        """Score resume vectors against a job description using the vocabulary they were fitted with"""
+        # Both sides are already L2-normalized, so one mat-vec gives the cosine similarities
+        job_vector = vectorizer.transform([job_text])
+        # The vectors are float32; scores come out float64 so they stay JSON serializable
+        if isinstance(resume_matrix, np.ndarray):
+            return (resume_matrix @ job_vector.toarray().ravel()).astype(np.float64)
+        return (resume_matrix @ job_vector.T).toarray().ravel().astype(np.float64)
+
+    def calculate_advanced_skill_match(self, job_skills: Dict, resume_skills: Dict,
+                                       job_skill_sets: Optional[Dict[str, frozenset]] = None) -> Tuple[float, Dict]:
         """Calculate skill match score with detailed breakdown"""
         total_job_skills = sum(len(skills) for skills in job_skills.values())
         if total_job_skills == 0:
             return 0.0, {}
         
+        # Callers ranking many resumes pass the sets in so they are built once per pass
+        if job_skill_sets is None:
+            job_skill_sets = {category: frozenset(skills) for category, skills in job_skills.items()}
+        
         skill_breakdown = {}
         matched_skills = 0
         
         for category, skills in job_skills.items():
             if category in resume_skills:
-                matched = list(set(skills) & set(resume_skills[category]))
+                job_set = job_skill_sets[category]
+                resume_set = resume_skills[category]
+                if not isinstance(resume_set, (set, frozenset)):
+                    resume_set = frozenset(resume_set)
+                matched = job_set & resume_set
                 skill_breakdown[category] = {
                     'required': len(skills),
                     'matched': len(matched),
-                    'matched_skills': matched,
-                    'missing_skills': list(set(skills) - set(resume_skills[category]))
+                    'matched_skills': list(matched),
+                    'missing_skills': list(job_set - resume_set)
                 }
                 matched_skills += len(matched)
             else:
@@ -443,6 +965,20 @@ class UniversalResumeRanker:
         
         return recommendations
 
+    def _map_resumes(self, func, items: List, chunksize: int = 1) -> List:
+        """Apply a module-level worker function to every item, using a process pool for large batches"""
+        max_workers = self.config.get('max_workers') or os.cpu_count() or 1
+        # A one-process pool only adds pickling and start-up cost, so it runs in-process instead
+        if max_workers > 1 and len(items) >= self.config.get('parallel_threshold', 32):
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers,
+                                         initializer=_init_worker, initargs=(self,)) as executor:
+                    return list(executor.map(func, items, chunksize=chunksize))
+            except Exception as e:
+                logger.warning(f"Process pool failed, falling back to sequential processing: {e}")
+        
+        return [func(item, ranker=self) for item in items]
+
     def _calculate_adaptive_weights(self, job_skills: Dict, job_exp_years: int) -> Dict[str, float]:
         """Calculate adaptive weights based on job requirements"""
         weights = {
@@ -480,21 +1016,26 @@ class UniversalResumeRanker:
             job_analysis = self.analyze_job_description(job_description)
             cleaned_job_desc = self.clean_text(job_description)
             
+            # Identical resume texts are parsed and scored once, then fanned back out
+            dup_groups: Dict[bytes, List[int]] = {}
+            for index, resume in enumerate(resumes_data):
+                key = hashlib.blake2b(resume.text.encode('utf-8'), digest_size=16).digest()
+                dup_groups.setdefault(key, []).append(index)
+            unique_groups = list(dup_groups.values())
+            if len(unique_groups) < len(resumes_data):
+                logger.info(f"Scoring {len(unique_groups)} unique texts for {len(resumes_data)} resumes")
+            
             # Process resumes
+            parse = partial(_parse_one, job_skills=job_analysis.skills_required)
+            parsed_unique = self._map_resumes(
+                parse, [resumes_data[group[0]] for group in unique_groups], chunksize=8
+            )
             processed_resumes = []
-            for resume in resumes_data:
-                try:
-                    parsed = self.parse_resume(
-                        resume.text, 
-                        resume.filename, 
-                        job_analysis.skills_required,
-                        getattr(resume, 'file_path', None)
-                    )
-                    parsed['sector'] = resume.sector
+            processed_groups = []
+            for parsed, group in zip(parsed_unique, unique_groups):
+                if parsed is not None:
                     processed_resumes.append(parsed)
-                except Exception as e:
-                    logger.error(f"Error processing resume {resume.filename}: {e}")
-                    continue
+                    processed_groups.append(group)
             
             if not processed_resumes:
                 logger.warning("No resumes were successfully processed")
@@ -504,76 +1045,107 @@ class UniversalResumeRanker:
             resume_texts = [resume['text'] for resume in processed_resumes]
             text_similarities = self.calculate_text_similarity(cleaned_job_desc, resume_texts)
             
+            # Job skills are fixed for the whole pass, so freeze them once
+            job_skill_sets = {
+                category: frozenset(skills)
+                for category, skills in job_analysis.skills_required.items()
+            }
+            
             # Calculate adaptive weights
             weights = self._calculate_adaptive_weights(
                 job_analysis.skills_required, 
                 job_analysis.experience_required
             )
             
-            results = []
+            # Bind per-iteration lookups to locals once for the scoring loop
+            skill_match = self.calculate_advanced_skill_match
+            gen_recs = self.generate_recommendations
+            job_skills = job_analysis.skills_required
+            exp_required = job_analysis.experience_required
+            edu_required = job_analysis.education_required
+            edu_divisor = max(edu_required, 3)
+            n_similarities = len(text_similarities)
+            
+            scored = []
+            append = scored.append
             for i, resume in enumerate(processed_resumes):
                 try:
                     # Calculate skill match with breakdown
-                    skill_score, skill_breakdown = self.calculate_advanced_skill_match(
-                        job_analysis.skills_required, 
-                        resume['skills']
-                    )
+                    skill_score, skill_breakdown = skill_match(job_skills, resume['skill_sets'], job_skill_sets)
                     
                     # Calculate scores
-                    text_similarity = text_similarities[i] if i < len(text_similarities) else 0.0
+                    text_similarity = text_similarities[i] if i < n_similarities else 0.0
+                    experience_years = resume['experience_years']
+                    education_score = resume['education_score']
                     
                     # Experience score calculation
-                    if job_analysis.experience_required > 0:
-                        exp_ratio = resume['experience_years'] / job_analysis.experience_required
+                    if exp_required > 0:
+                        exp_ratio = experience_years / exp_required
                         if exp_ratio <= 1:
                             exp_score = exp_ratio
                         else:
                             # Penalize over-qualification slightly
                             exp_score = 1.0 - min((exp_ratio - 1) * 0.1, 0.3)
                     else:
-                        exp_score = min(resume['experience_years'] / 5, 1.0)
+                        exp_score = min(experience_years / 5, 1.0)
                     
                     # Education score
-                    edu_score = min(resume['education_score'] / max(job_analysis.education_required, 3), 1.0)
-                    
-                    # Combined score
-                    combined_score = (
-                        weights['text'] * text_similarity +
-                        weights['skills'] * skill_score +
-                        weights['experience'] * exp_score +
-                        weights['education'] * edu_score
-                    )
-                    
-                    # Calculate match percentage
-                    match_percentage = combined_score * 100
+                    edu_score = min(education_score / edu_divisor, 1.0)
                     
                     # Generate recommendations
-                    experience_gap = max(0, job_analysis.experience_required - resume['experience_years'])
-                    education_gap = max(0, job_analysis.education_required - resume['education_score'])
-                    recommendations = self.generate_recommendations(skill_breakdown, experience_gap, education_gap)
-                    
-                    result = RankingResult(
-                        filename=resume['filename'],
-                        sector=resume['sector'],
-                        combined_score=combined_score,
-                        text_similarity=text_similarity,
-                        skill_score=skill_score,
-                        experience_score=exp_score,
-                        education_score=edu_score,
-                        experience_years=resume['experience_years'],
-                        education_level=resume['education_score'],
-                        skills_found=resume['skills'],
-                        match_percentage=match_percentage,
-                        recommendations=recommendations,
-                        file_path=resume.get('file_path')
-                    )
+                    experience_gap = max(0, exp_required - experience_years)
+                    education_gap = max(0, edu_required - education_score)
+                    recommendations = gen_recs(skill_breakdown, experience_gap, education_gap)
                     
-                    results.append(result)
+                    append((resume, text_similarity, skill_score, exp_score, edu_score, recommendations,
+                            processed_groups[i]))
                     
                 except Exception as e:
                     logger.error(f"Error calculating scores for resume {resume['filename']}: {e}")
                     continue
             
+            # Combined score for every resume in one vectorized expression
+            sims, skill_scores, exp_scores, edu_scores = (
+                np.fromiter((entry[col] for entry in scored), dtype=np.float64, count=len(scored))
+                for col in range(1, 5)
+            )
+            combined_scores = (
+                weights['text'] * sims +
+                weights['skills'] * skill_scores +
+                weights['experience'] * exp_scores +
+                weights['education'] * edu_scores
+            )
+            match_percentages = combined_scores * 100
+            
+            results = []
+            for i, (resume, text_similarity, skill_score, exp_score, edu_score, recommendations,
+                    group) in enumerate(scored):
+                result = RankingResult(
+                    filename=resume['filename'],
+                    sector=resume['sector'],
+                    combined_score=combined_scores[i],
+                    text_similarity=text_similarity,
+                    skill_score=skill_score,
+                    experience_score=exp_score,
+                    education_score=edu_score,
+                    experience_years=resume['experience_years'],
+                    education_level=resume['education_score'],
+                    skills_found=resume['skills'],
+                    match_percentage=match_percentages[i],
+                    recommendations=recommendations,
+                    file_path=resume.get('file_path')
+                )
+                results.append(result)
+                # Duplicates share the scores but keep their own file identity
+                for index in group[1:]:
+                    duplicate = resumes_data[index]
+                    results.append(replace(
+                        result,
+                        filename=duplicate.filename,
+                        sector=duplicate.sector,
+                        file_path=getattr(duplicate, 'file_path', None)
+                    ))
+            
             # Sort by combined score
             sorted_results = sorted(results, key=lambda x: x.combined_score, reverse=True)
             logger.info(f"Successfully ranked {len(sorted_results)} resumes")
@@ -586,49 +1158,50 @@ class UniversalResumeRanker:
 
 
     def process_resume_folder(self, folder_path: str)-> List[ResumeData]:
-        resumes_data = []
-        folder = Path(folder_path)
-
-        for file_path in folder.glob("*.pdf"):
-            try:
-                text, metadata = self.extract_text_from_pdf(file_path)
-                cleaned_text = self.clean_text(text)
-
-                resume_data = ResumeData(
-                    filename=file_path.name,
-                    sector="General",  # or infer if you want
-                    text=cleaned_text,
-                    file_path=str(file_path),
-                    file_size=os.path.getsize(file_path),
-                    processing_time=None  # optional
-                )
-
-                resumes_data.append(resume_data)
-
-            except Exception as e:
-                self.logger.warning(f"Failed to process {file_path}: {e}")
-
-        return resumes_data
+        """Extract every PDF in a folder, spreading large folders over a process pool"""
+        # One directory scan yields each PDF with its size, so workers never stat the file again
+        try:
+            with os.scandir(folder_path) as entries:
+                files = [(entry.path, entry.stat().st_size) for entry in entries
+                         if entry.name.lower().endswith('.pdf') and entry.is_file()]
+        except OSError as e:
+            self.logger.warning(f"Could not read resume folder {folder_path}: {e}")
+            return []
+        
+        # Files that fail to extract come back as None and are dropped
+        return [resume_data for resume_data in self._map_resumes(_process_one_pdf, files, chunksize=4)
+                if resume_data is not None]
 
     def get_summary_statistics(self, results: List[RankingResult]) -> Dict[str, Any]:
         """Get summary statistics for ranking results"""
         if not results:
             return {}
         
-        scores = [r.combined_score for r in results]
-        match_percentages = [r.match_percentage for r in results]
+        n = len(results)
+        scores = np.fromiter((r.combined_score for r in results), dtype=np.float64, count=n)
+        sector_counts = Counter(r.sector for r in results)
+        match_percentages = np.fromiter((r.match_percentage for r in results), dtype=np.float64, count=n)
+        
+        # One partial sort places every order statistic needed: min, max, the median pair and
+        # the two neighbours the 90th percentile interpolates between
+        median_lo, median_hi = (n - 1) // 2, n // 2
+        p90_position = 0.9 * (n - 1)
+        p90_lo = int(p90_position)
+        p90_hi = min(p90_lo + 1, n - 1)
+        ordered = np.partition(scores, sorted({0, median_lo, median_hi, p90_lo, p90_hi, n - 1}))
+        p90_fraction = p90_position - p90_lo
         
         return {
-            'total_resumes': len(results),
-            'average_score': np.mean(scores),
-            'median_score': np.median(scores),
-            'std_score': np.std(scores),
-            'min_score': np.min(scores),
-            'max_score': np.max(scores),
-            'average_match_percentage': np.mean(match_percentages),
-            'top_10_percent_threshold': np.percentile(scores, 90),
-            'sectors_represented': len(set(r.sector for r in results)),
-            'sector_distribution': dict(Counter(r.sector for r in results))
+            'total_resumes': n,
+            'average_score': scores.mean(),
+            'median_score': (ordered[median_lo] + ordered[median_hi]) / 2,
+            'std_score': scores.std(),
+            'min_score': ordered[0],
+            'max_score': ordered[n - 1],
+            'average_match_percentage': match_percentages.mean(),
+            'top_10_percent_threshold': ordered[p90_lo] + (ordered[p90_hi] - ordered[p90_lo]) * p90_fraction,
+            'sectors_represented': len(sector_counts),
+            'sector_distribution': dict(sector_counts)
         }
 
     def export_results_json(self, results: List[RankingResult], job_analysis: JobAnalysis, 
@@ -657,8 +1230,14 @@ class UniversalResumeRanker:
                 'summary_statistics': summary_stats
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # orjson produces UTF-8 bytes directly and encodes NumPy scalars natively
+                payload = orjson.dumps(
+                    export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                payload = json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8')
+            _write_export(filename, payload)
             
             logger.info(f"Results exported to {filename}")
             return filename
@@ -671,34 +1250,39 @@ class UniversalResumeRanker:
                               filename: str = 'detailed_resume_ranking.csv') -> str:
         """Export detailed results to CSV with enhanced information"""
         try:
-            export_data = []
-            for result in ranked_results:
-                # Flatten skills for CSV export
-                all_skills = []
-                for category, skills in result.skills_found.items():
-                    for skill in skills:
-                        all_skills.append(f"{category}:{skill}")
-                
-                export_data.append({
-                    'Rank': ranked_results.index(result) + 1,
-                    'Filename': result.filename,
-                    'Sector': result.sector,
-                    'Overall_Score': round(result.combined_score, 4),
-                    'Match_Percentage': round(result.match_percentage, 2),
-                    'Text_Similarity': round(result.text_similarity, 4),
-                    'Skill_Score': round(result.skill_score, 4),
-                    'Experience_Score': round(result.experience_score, 4),
-                    'Education_Score': round(result.education_score, 4),
-                    'Experience_Years': result.experience_years,
-                    'Education_Level': result.education_level,
-                    'Skills_Count': len(all_skills),
-                    'All_Skills': ' | '.join(all_skills),
-                    'Recommendations': ' | '.join(result.recommendations),
-                    'File_Path': result.file_path or ''
-                })
-            
-            df = pd.DataFrame(export_data)
-            df.to_csv(filename, index=False)
+            # Rows go straight into one text buffer with no intermediate table; the encoded
+            # bytes are written to disk once and kept in memory for downloads while the file is unchanged
+            with io.StringIO(newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=_DETAILED_EXPORT_FIELDS, lineterminator=os.linesep)
+                writer.writeheader()
+                for rank, result in enumerate(ranked_results, 1):
+                    # Flatten skills for CSV export
+                    all_skills = [
+                        f"{category}:{skill}"
+                        for category, skills in result.skills_found.items()
+                        for skill in skills
+                    ]
+                    
+                    writer.writerow({
+                        'Rank': rank,
+                        'Filename': result.filename,
+                        'Sector': result.sector,
+                        'Overall_Score': round(result.combined_score, 4),
+                        'Match_Percentage': round(result.match_percentage, 2),
+                        'Text_Similarity': round(result.text_similarity, 4),
+                        'Skill_Score': round(result.skill_score, 4),
+                        'Experience_Score': round(result.experience_score, 4),
+                        'Education_Score': round(result.education_score, 4),
+                        'Experience_Years': result.experience_years,
+                        'Education_Level': result.education_level,
+                        'Skills_Count': len(all_skills),
+                        'All_Skills': ' | '.join(all_skills),
+                        'Recommendations': ' | '.join(result.recommendations),
+                        'File_Path': result.file_path or ''
+                    })
+                payload = f.getvalue().encode('utf-8')
+            
+            _write_export(filename, payload)
             logger.info(f"Detailed results exported to {filename}")
             return filename
             
@@ -712,11 +1296,6 @@ class UniversalResumeRanker:
         candidates = []
         
         for i, result in enumerate(top_results, 1):
-            # Get top skills across all categories
-            all_skills = []
-            for category, skills in result.skills_found.items():
-                all_skills.extend(skills)
-            
             candidate = {
                 'rank': i,
                 'filename': result.filename,
@@ -725,33 +1304,16 @@ class UniversalResumeRanker:
                 'overall_score': round(result.combined_score, 3),
                 'experience_years': result.experience_years,
                 'education_level': result.education_level,
-                'top_skills': all_skills[:10],  # Top 10 skills
+                'top_skills': list(result.flat_skills[:10]),  # Top 10 skills
                 'skill_categories': list(result.skills_found.keys()),
                 'recommendations_count': len(result.recommendations),
-                'strengths': self._identify_strengths(result),
+                'strengths': list(result.strengths),
                 'file_path': result.file_path
             }
             candidates.append(candidate)
         
         return candidates
 
-    def _identify_strengths(self, result: RankingResult) -> List[str]:
-        """Identify candidate strengths based on scores"""
-        strengths = []
-        
-        if result.skill_score > 0.7:
-            strengths.append("Strong skill match")
-        if result.experience_score > 0.8:
-            strengths.append("Excellent experience level")
-        if result.education_score > 0.8:
-            strengths.append("Strong educational background")
-        if result.text_similarity > 0.6:
-            strengths.append("High content relevance")
-        if result.match_percentage > 85:
-            strengths.append("Exceptional overall match")
-        
-        return strengths
-
     def display_results(self, ranked_results: List[RankingResult], top_n: int = 10):
         """Display ranking results with enhanced formatting"""
         if not ranked_results:
@@ -782,9 +1344,8 @@ class UniversalResumeRanker:
                 print(f"   Key Skills: {' | '.join(all_skills[:5])}")
             
             # Display strengths
-            strengths = self._identify_strengths(result)
-            if strengths:
-                print(f"   Strengths: {', '.join(strengths)}")
+            if result.strengths:
+                print(f"   Strengths: {', '.join(result.strengths)}")
             
             # Display top recommendations
             if result.recommendations:
@@ -798,29 +1359,37 @@ class UniversalResumeRanker:
         summary_stats = self.get_summary_statistics(results)
         top_candidates = self.get_top_candidates(results, 10)
         
-        # Score distribution for charts
+        # One pass over the results gathers everything the charts and counters below need
+        match_percentages = np.empty(len(results), dtype=np.float64)
+        experience_years = np.empty(len(results), dtype=np.int64)
+        skill_frequency = Counter()
+        skill_categories = set()
+        for i, result in enumerate(results):
+            match_percentages[i] = result.match_percentage
+            experience_years[i] = result.experience_years
+            skill_frequency.update(result.flat_skills)
+            skill_categories.update(result.skills_found)
+        
+        # Score distribution for charts, bucketed in one histogram call
+        below_60, in_60s, in_70s, in_80s, from_90 = np.histogram(
+            match_percentages, bins=[-np.inf, 60, 70, 80, 90, np.inf]
+        )[0].tolist()
         score_ranges = {
-            '90-100%': len([r for r in results if r.match_percentage >= 90]),
-            '80-89%': len([r for r in results if 80 <= r.match_percentage < 90]),
-            '70-79%': len([r for r in results if 70 <= r.match_percentage < 80]),
-            '60-69%': len([r for r in results if 60 <= r.match_percentage < 70]),
-            'Below 60%': len([r for r in results if r.match_percentage < 60])
+            '90-100%': from_90,
+            '80-89%': in_80s,
+            '70-79%': in_70s,
+            '60-69%': in_60s,
+            'Below 60%': below_60
         }
         
-        # Experience distribution
-        exp_distribution = {}
-        for result in results:
-            exp_range = f"{(result.experience_years // 5) * 5}-{(result.experience_years // 5) * 5 + 4} years"
-            exp_distribution[exp_range] = exp_distribution.get(exp_range, 0) + 1
-        
-        # Skill analysis
-        skill_frequency = {}
-        for result in results:
-            for category, skills in result.skills_found.items():
-                for skill in skills:
-                    skill_frequency[skill] = skill_frequency.get(skill, 0) + 1
+        # Experience distribution in five-year buckets, youngest bucket first
+        exp_buckets, exp_counts = np.unique((experience_years // 5) * 5, return_counts=True)
+        exp_distribution = {
+            f"{bucket}-{bucket + 4} years": count for bucket, count in zip(exp_buckets.tolist(), exp_counts.tolist())
+        }
         
-        top_skills = sorted(skill_frequency.items(), key=lambda x: x[1], reverse=True)[:15]
+        # Skill analysis; most_common keeps first-seen order among equal counts, like a stable sort
+        top_skills = skill_frequency.most_common(15)
         
         dashboard_data = {
             'job_analysis': {
@@ -839,16 +1408,13 @@ class UniversalResumeRanker:
             },
             'skill_analysis': {
                 'most_common_skills': [{'skill': skill, 'frequency': freq} for skill, freq in top_skills],
-                'skill_categories': list(set(
-                    category for result in results 
-                    for category in result.skills_found.keys()
-                ))
+                'skill_categories': list(skill_categories)
             },
             'recommendations': {
                 'total_candidates': len(results),
-                'qualified_candidates': len([r for r in results if r.match_percentage >= 70]),
-                'highly_qualified': len([r for r in results if r.match_percentage >= 85]),
-                'avg_experience': round(np.mean([r.experience_years for r in results]), 1)
+                'qualified_candidates': int(np.count_nonzero(match_percentages >= 70)),
+                'highly_qualified': int(np.count_nonzero(match_percentages >= 85)),
+                'avg_experience': round(experience_years.mean(), 1)
             }
         }
         
@@ -860,6 +1426,25 @@ class ResumeRankerAPI:
     def __init__(self, config: Optional[Dict] = None):
         self.ranker = UniversalResumeRanker(config)
         self.logger = logging.getLogger(__name__)
+        # Recent responses keyed by request and folder contents, with what is needed to re-export them
+        self._result_cache: 'OrderedDict[bytes, Tuple[Dict, List[RankingResult], JobAnalysis, Dict]]' = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # Request whose ranking this process last exported; the files only still hold it if get_export agrees
+        self._exported_key: Optional[bytes] = None
+    
+    def _result_key(self, job_description: str, resume_folder: str, top_n: int,
+                    resumes_data: List[ResumeData]) -> Optional[bytes]:
+        """Key a ranking request by its inputs and the content of every resume, or None if uncacheable"""
+        if not self.ranker.config['enable_caching'] or any(r.content_hash is None for r in resumes_data):
+            return None
+        
+        # Filenames are part of the output, so a rename is a different request even with the same bytes
+        files = sorted(f"{r.filename}:{r.content_hash}" for r in resumes_data)
+        key = hashlib.blake2b(digest_size=16)
+        for part in (job_description, os.path.abspath(resume_folder), str(top_n), *files):
+            key.update(part.encode('utf-8'))
+            key.update(b'\0')
+        return key.digest()
     
     def analyze_job_and_rank(self, job_description: str, resume_folder: str, 
                            top_n: int = 10) -> Dict[str, Any]:
@@ -870,6 +1455,26 @@ class ResumeRankerAPI:
             if not resumes_data:
                 return {'error': 'No resumes found or processed', 'success': False}
             
+            # An unchanged folder and job description give the same response, so skip the ranking
+            cache_key = self._result_key(job_description, resume_folder, top_n, resumes_data)
+            cached = None
+            if cache_key is not None:
+                with self._result_cache_lock:
+                    cached = self._result_cache.get(cache_key)
+                    if cached is not None:
+                        self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                response, results, job_analysis, summary_stats = cached
+                exports = response['exports']
+                if (self._exported_key != cache_key or self.get_export(exports['json_file']) is None
+                        or self.get_export(exports['csv_file']) is None):
+                    # Another request, in this worker or another one, has overwritten the export files since
+                    self.ranker.export_results_json(results, job_analysis, summary_stats)
+                    self.ranker.export_detailed_results(results)
+                    self._exported_key = cache_key
+                self.logger.info("Returning cached ranking for an unchanged job description and folder")
+                return response
+            
             # Analyze job description
             job_analysis = self.ranker.analyze_job_description(job_description)
             
@@ -884,8 +1489,9 @@ class ResumeRankerAPI:
                 results, job_analysis, dashboard_data['summary']
             )
             csv_file = self.ranker.export_detailed_results(results)
+            self._exported_key = cache_key
             
-            return {
+            response = {
                 'success': True,
                 'dashboard_data': dashboard_data,
                 'top_candidates': self.ranker.get_top_candidates(results, top_n),
@@ -903,10 +1509,21 @@ class ResumeRankerAPI:
                 }
             }
             
+            if cache_key is not None:
+                with self._result_cache_lock:
+                    self._result_cache[cache_key] = (response, results, job_analysis, dashboard_data['summary'])
+                    while len(self._result_cache) > self.ranker.config.get('result_cache_size', 32):
+                        self._result_cache.popitem(last=False)
+            return response
+            
         except Exception as e:
             self.logger.error(f"API Error: {e}")
             return {'error': str(e), 'success': False}
     
+    def get_export(self, filename: str) -> Optional[bytes]:
+        """Bytes this process last exported to filename, or None if the file on disk is no longer that export"""
+        return _read_export(filename)
+    
     def rank_single_resume(self, job_description: str, resume_text: str, 
                           filename: str = "single_resume.pdf") -> Dict[str, Any]:
         """Rank a single resume against job description"""
@@ -943,7 +1560,7 @@ class ResumeRankerAPI:
                     'skills_found': result.skills_found
                 },
                 'recommendations': result.recommendations,
-                'strengths': self.ranker._identify_strengths(result)
+                'strengths': list(result.strengths)
             }
             
         except Exception as e:
@@ -1,5 +1,6 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+import io
 import os
 import json
 from pathlib import Path
@@ -16,6 +17,12 @@ CORS(app, supports_credentials=True, origins=["http://localhost:5173", "http://l
 # Initialize the resume ranker API
 ranker_api = ResumeRankerAPI()
 
+# Export files served by /api/download/<file_type>, as (filename, mimetype)
+DOWNLOAD_TYPES = {
+    'json': ('ranking_results.json', 'application/json'),
+    'csv': ('detailed_resume_ranking.csv', 'text/csv')
+}
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -92,23 +99,27 @@ def upload_resume():
         if file.filename == '':
             return jsonify({"error": "No file selected"}), 400
         
-        # Save the uploaded file
         upload_folder = 'uploads'
         os.makedirs(upload_folder, exist_ok=True)
-        
         file_path = os.path.join(upload_folder, file.filename)
-        file.save(file_path)
         
-        # Extract text from the uploaded file
+        # Extract text straight from the uploaded bytes instead of re-reading the saved file
+        data = file.read()
         try:
             if file.filename.lower().endswith('.pdf'):
-                text, metadata = ranker_api.ranker.extract_text_from_pdf(Path(file_path))
+                text, metadata = ranker_api.ranker.extract_text_from_pdf(Path(file_path), data)
             else:
                 # For text files
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
+                text = data.decode('utf-8')
                 metadata = {}
             
+            # extract_text_from_pdf reports failures as empty text, so an unreadable file is never kept
+            if not text.strip():
+                return jsonify({"error": "Failed to extract text from file: no readable text found"}), 400
+            
+            # Keep the upload for later analyze-job runs; written once, after extraction succeeded
+            Path(file_path).write_bytes(data)
+            
             return jsonify({
                 "success": True,
                 "filename": file.filename,
@@ -131,6 +142,13 @@ def get_results(filename):
         if not os.path.exists(file_path):
             return jsonify({"error": "File not found"}), 404
         
+        # Serve the bytes kept from this process's export while the file is unchanged; otherwise read it
+        content = ranker_api.get_export(file_path)
+        if content is not None:
+            if filename.endswith('.json'):
+                return content, 200, {'Content-Type': 'application/json'}
+            return content, 200, {'Content-Type': 'text/plain'}
+        
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
@@ -147,22 +165,19 @@ def get_results(filename):
 def download_results(file_type):
     """Download results as JSON or CSV"""
     try:
-        if file_type == 'json':
-            filename = 'ranking_results.json'
-            mimetype = 'application/json'
-        elif file_type == 'csv':
-            filename = 'detailed_resume_ranking.csv'
-            mimetype = 'text/csv'
-        else:
+        if file_type not in DOWNLOAD_TYPES:
             return jsonify({"error": "Invalid file type. Use 'json' or 'csv'"}), 400
+        filename, mimetype = DOWNLOAD_TYPES[file_type]
         
         file_path = os.path.join(os.getcwd(), filename)
         if not os.path.exists(file_path):
             return jsonify({"error": f"File {filename} not found. Please run an analysis first."}), 404
         
         from flask import send_file
+        # Serve the bytes kept from this process's export while the file is unchanged, else the file on disk
+        content = ranker_api.get_export(file_path)
         return send_file(
-            file_path,
+            io.BytesIO(content) if content is not None else file_path,
             as_attachment=True,
             download_name=filename,
             mimetype=mimetype
@@ -182,4 +197,5 @@ if __name__ == '__main__':
     print("- GET  /api/get-results/<filename> - Get exported results")
     print("- GET  /api/download/<file_type> - Download JSON or CSV results")
     
-    app.run(host='0.0.0.0', port=5000, debug=True) 
\ No newline at end of file
+    # Development server only; in production run: gunicorn -c gunicorn.conf.py flask_server:app
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1') 
\ No newline at end of file
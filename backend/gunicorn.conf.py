@@ -0,0 +1,38 @@
+"""Gunicorn settings for serving the Resume Ranker API in production
+
+Run from the backend folder with: gunicorn -c gunicorn.conf.py flask_server:app
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+
+# One process per core; each worker keeps its own ranker and caches
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+
+# Each worker ranks large folders on its own process pool, so split the cores between the
+# workers instead of letting every one of them start a process per core. With one worker per
+# core that leaves each worker a single process, so rankings run in-process with no pool at all
+os.environ.setdefault('RANKER_MAX_WORKERS', str(max(1, multiprocessing.cpu_count() // workers)))
+
+# Threads let uploads and downloads proceed while another request in the same worker is ranking
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Ranking a large folder can take well over the default 30 seconds
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
+
+# Import the app, the ranker and the skills database once in the master and fork the workers
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    """With PRELOAD_SPACY=1, load spaCy in the master so every forked worker shares it copy-on-write"""
+    # No route needs spaCy with the default lazy_spacy config, so by default it is never loaded at all
+    if os.environ.get('PRELOAD_SPACY') != '1':
+        return
+    from enhanced_resume_ranker_connect import load_shared_models
+    load_shared_models()
@@ -0,0 +1,137 @@
+import os
+
+import numpy as np
+import pytest
+
+import enhanced_resume_ranker_connect as ranker_module
+from enhanced_resume_ranker_connect import (RankingResult, UniversalResumeRanker, _build_skill_automaton,
+                                            _read_export, _write_export)
+
+# Skills whose matches overlap, to pin the word-boundary rules of the Aho-Corasick scan
+_SKILLS = ['java', 'javascript', 'c++', 'c#', 'sql', 'excel']
+
+def _ranker(tmp_path, **overrides):
+    """Ranker whose on-disk caches live under tmp_path"""
+    config = UniversalResumeRanker._get_default_config(None)
+    config.update(cache_dir=str(tmp_path / 'cache'), **overrides)
+    return UniversalResumeRanker(config)
+
+@pytest.fixture
+def ranker(tmp_path):
+    return _ranker(tmp_path)
+
+@pytest.mark.parametrize('text,expected', [
+    ('senior javascript developer', {'javascript'}),
+    ('java, sql and javascript', {'java', 'sql', 'javascript'}),
+    ('excellent communicator', set()),
+    ('mysql and excel', {'excel'}),
+    ('c++ and c# developer', {'c++', 'c#'}),
+    ('modern c++11', {'c++'}),
+    ('abc++ framework', set()),
+])
+def test_skills_match_on_word_boundaries(ranker, text, expected):
+    """A skill only matches as a whole word, never inside a longer one"""
+    assert ranker._match_skills(text, _build_skill_automaton(sorted(_SKILLS))) == expected
+
+@pytest.mark.parametrize('text,expected', [
+    ('no dates here', 0),
+    ('5 years of experience in python', 5),
+    ('(7 years)', 7),
+    ('sales manager 2018-present', 7),
+    # Every phrase counts, even when two roles have the same length
+    ('3 years of experience at acme. 3 years of experience at globex', 6),
+    ('40 years of experience and 20 years of experience', 50),
+])
+def test_experience_years(ranker, text, expected):
+    """Experience phrases are summed over the whole text and capped at 50 years"""
+    assert ranker.extract_experience_years(text) == expected
+
+def _result(score):
+    """RankingResult carrying only a score"""
+    return RankingResult(filename='a.pdf', sector='General', combined_score=score, text_similarity=0.0,
+                         skill_score=0.0, experience_score=0.0, education_score=0.0, experience_years=0,
+                         education_level=1, skills_found={}, match_percentage=score * 100,
+                         recommendations=[])
+
+@pytest.mark.parametrize('n', [1, 2, 3, 10, 11, 101])
+def test_summary_statistics_match_numpy(ranker, n):
+    """The partition-based order statistics agree with np.median and np.percentile"""
+    scores = np.random.default_rng(n).random(n)
+    stats = ranker.get_summary_statistics([_result(score) for score in scores])
+    assert stats['median_score'] == pytest.approx(np.median(scores))
+    assert stats['top_10_percent_threshold'] == pytest.approx(np.percentile(scores, 90))
+    assert stats['min_score'] == scores.min()
+    assert stats['max_score'] == scores.max()
+
+def test_text_cache_rejects_stale_entries(ranker, monkeypatch):
+    """Text cached under another text cap or extractor version is a miss"""
+    ranker._write_text_cache('abc', 'cleaned text', {'pages': 1})
+    assert ranker._read_text_cache('abc') == 'cleaned text'
+
+    ranker.config['max_text_chars'] = 1000
+    assert ranker._read_text_cache('abc') is None
+    ranker.config['max_text_chars'] = 200_000
+
+    monkeypatch.setattr(ranker_module, '_EXTRACTOR_VERSION', ranker_module._EXTRACTOR_VERSION + 1)
+    assert ranker._read_text_cache('abc') is None
+
+def test_feature_cache_invalidation(ranker, tmp_path, monkeypatch):
+    """Features are recomputed when the file, its text or the extractor version changes"""
+    calls = []
+    extract_contact_info = ranker.extract_contact_info
+    monkeypatch.setattr(ranker, 'extract_contact_info', lambda text: calls.append(text) or extract_contact_info(text))
+    resume = tmp_path / 'resume.pdf'
+    resume.write_bytes(b'%PDF')
+    text = '5 years of experience with sql'
+
+    ranker._resume_features(text, str(resume))
+    ranker._resume_features(text, str(resume))
+    assert len(calls) == 1
+
+    stat = resume.stat()
+    os.utime(resume, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    ranker._resume_features(text, str(resume))
+    assert len(calls) == 2
+
+    ranker._resume_features(text.replace('sql', 'SQL'), str(resume))
+    assert len(calls) == 3
+
+    monkeypatch.setattr(ranker_module, '_EXTRACTOR_VERSION', ranker_module._EXTRACTOR_VERSION + 1)
+    ranker._resume_features(text, str(resume))
+    assert len(calls) == 4
+
+def test_export_served_only_while_unchanged(tmp_path):
+    """An export's cached bytes are dropped once another file replaces it or it is deleted"""
+    path = str(tmp_path / 'ranking_results.json')
+    _write_export(path, b'{"a": 1}')
+    assert _read_export(path) == b'{"a": 1}'
+
+    # Same size, written by someone else: only the identity check can tell it apart
+    other = tmp_path / 'other.json'
+    other.write_bytes(b'{"b": 2}')
+    os.replace(other, path)
+    assert _read_export(path) is None
+
+    _write_export(path, b'{"c": 3}')
+    os.remove(path)
+    assert _read_export(path) is None
+    assert _read_export(str(tmp_path / 'never_written.json')) is None
+
+def test_subset_scores_match_a_fresh_fit(tmp_path):
+    """Scoring a subset after a larger batch gives the same scores as a ranker that never saw the rest"""
+    job = 'python developer with sql and machine learning experience'
+    texts = [
+        'python developer sql databases machine learning',
+        'java developer sql databases spring',
+        'python data analyst sql reporting',
+        'machine learning engineer python research',
+        'sales manager customer relations reporting',
+    ]
+    warm = _ranker(tmp_path / 'warm', enable_caching=False)
+    warm.calculate_text_similarity(job, texts)
+    subset = warm.calculate_text_similarity(job, texts[:3])
+    fresh = _ranker(tmp_path / 'fresh', enable_caching=False).calculate_text_similarity(job, texts[:3])
+    np.testing.assert_allclose(subset, fresh, atol=1e-6)
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-v']))